@@ -58,6 +58,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'task_analyzer.wsgi.application'
+ASGI_APPLICATION = 'task_analyzer.asgi.application'
 
 # Database
 DATABASES = {
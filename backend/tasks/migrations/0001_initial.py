@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-15 11:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Task',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('due_date', models.DateField(blank=True, db_index=True, null=True)),
+                ('estimated_hours', models.FloatField(default=1.0)),
+                ('importance', models.IntegerField(default=5)),
+                ('dependencies', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -10,11 +10,11 @@ class Task(models.Model):
     Task model representing a task with priority scoring attributes.
     """
     title = models.CharField(max_length=255)
-    due_date = models.DateField(null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
     estimated_hours = models.FloatField(default=1.0)
     importance = models.IntegerField(default=5)  # 1-10 scale
     dependencies = models.JSONField(default=list, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)  # default ordering
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -17,8 +17,13 @@ Final Score = (Urgency × W1) + (Importance × W2) + (Effort × W3) + (Dependenc
 The weights are configurable through different strategies.
 """
 
+from bisect import bisect_right
+from collections import defaultdict, deque
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from heapq import nlargest
+from math import log2
+from typing import Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -31,9 +36,11 @@ class SortingStrategy(Enum):
     DEADLINE_DRIVEN = "deadline_driven"
 
 
-@dataclass
+@dataclass(frozen=True)
 class StrategyWeights:
     """Weight configuration for each scoring factor."""
+    __slots__ = ('urgency', 'importance', 'effort', 'dependency')
+
     urgency: float
     importance: float
     effort: float
@@ -60,18 +67,67 @@ STRATEGY_WEIGHTS: Dict[SortingStrategy, StrategyWeights] = {
     SortingStrategy.DEADLINE_DRIVEN: StrategyWeights(0.60, 0.20, 0.05, 0.15),
 }
 
+# Normalized once at import; there is only a handful of strategies
+NORMALIZED_WEIGHTS: Dict[SortingStrategy, StrategyWeights] = {
+    strategy: weights.normalize() for strategy, weights in STRATEGY_WEIGHTS.items()
+}
+
+# Weights in component score order: (urgency, importance, effort, dependency)
+WEIGHT_VECTORS: Dict[SortingStrategy, Tuple[float, float, float, float]] = {
+    strategy: (weights.urgency, weights.importance, weights.effort, weights.dependency)
+    for strategy, weights in NORMALIZED_WEIGHTS.items()
+}
+
+# Rounded display form of the weights; results get their own copy of it
+WEIGHTS_USED: Dict[SortingStrategy, Dict[str, float]] = {
+    strategy: {
+        'urgency': round(weights.urgency, 2),
+        'importance': round(weights.importance, 2),
+        'effort': round(weights.effort, 2),
+        'dependency': round(weights.dependency, 2),
+    }
+    for strategy, weights in NORMALIZED_WEIGHTS.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date:
+    """Parse an ISO date string, memoized since task lists often repeat dates."""
+    return date.fromisoformat(value)
+
 
 class TaskValidator:
     """Validates and sanitizes task data."""
+    __slots__ = ()
 
     @staticmethod
-    def validate_task(task: Dict[str, Any]) -> Tuple[bool, List[str], Dict[str, Any]]:
+    def validate_task(
+        task: Dict[str, Any],
+        trusted: bool = False
+    ) -> Tuple[bool, List[str], Dict[str, Any]]:
         """
         Validate a single task and return sanitized data.
         
+        Args:
+            task: Raw task dictionary
+            trusted: The task already passed TaskSerializer validation, so
+                only defaults are filled in and no checks are repeated
+        
         Returns:
             Tuple of (is_valid, errors, sanitized_task)
         """
+        if trusted:
+            sanitized = {
+                'title': task['title'],
+                'due_date': task.get('due_date'),
+                'estimated_hours': task.get('estimated_hours', 1.0),
+                'importance': task.get('importance', 5),
+                'dependencies': task.get('dependencies', []),
+            }
+            if 'id' in task:
+                sanitized['id'] = task['id']
+            return True, [], sanitized
+
         errors = []
         sanitized = {}
 
@@ -86,7 +142,7 @@ class TaskValidator:
         if due_date:
             try:
                 if isinstance(due_date, str):
-                    sanitized['due_date'] = date.fromisoformat(due_date)
+                    sanitized['due_date'] = _parse_iso_date(due_date)
                 elif isinstance(due_date, date):
                     sanitized['due_date'] = due_date
                 else:
@@ -100,17 +156,21 @@ class TaskValidator:
 
         # Validate estimated_hours
         estimated_hours = task.get('estimated_hours', 1)
-        try:
+        if isinstance(estimated_hours, (int, float)):
+            # Common case: already numeric, no need for exception handling
             estimated_hours = float(estimated_hours)
-            if estimated_hours <= 0:
-                errors.append("estimated_hours must be positive, defaulting to 1")
+        else:
+            try:
+                estimated_hours = float(estimated_hours)
+            except (TypeError, ValueError):
+                errors.append(f"Invalid estimated_hours: {estimated_hours}, defaulting to 1")
                 estimated_hours = 1.0
-            elif estimated_hours > 1000:
-                errors.append("estimated_hours seems unreasonably high, capping at 1000")
-                estimated_hours = 1000.0
-        except (TypeError, ValueError):
-            errors.append(f"Invalid estimated_hours: {estimated_hours}, defaulting to 1")
+        if estimated_hours <= 0:
+            errors.append("estimated_hours must be positive, defaulting to 1")
             estimated_hours = 1.0
+        elif estimated_hours > 1000:
+            errors.append("estimated_hours seems unreasonably high, capping at 1000")
+            estimated_hours = 1000.0
         sanitized['estimated_hours'] = estimated_hours
 
         # Validate importance (1-10 scale)
@@ -143,54 +203,98 @@ class TaskValidator:
 
 class DependencyAnalyzer:
     """Analyzes task dependencies for circular references and blocking relationships."""
+    __slots__ = ()
 
     @staticmethod
     def detect_circular_dependencies(tasks: List[Dict]) -> List[List[str]]:
         """
         Detect circular dependencies in a list of tasks.
         
-        Uses DFS to find cycles in the dependency graph.
+        Acyclic tasks are peeled off with Kahn's algorithm first; an iterative
+        DFS then walks only what is left, so deep dependency chains cannot hit
+        the recursion limit.
         
         Returns:
             List of cycles found (each cycle is a list of task IDs)
         """
         # Build adjacency list
-        task_ids = {str(task.get('id', i)): task for i, task in enumerate(tasks)}
+        task_ids = [str(task.get('id', i)) for i, task in enumerate(tasks)]
+        known_ids = set(task_ids)
         graph = {}
         
-        for i, task in enumerate(tasks):
-            task_id = str(task.get('id', i))
-            deps = task.get('dependencies', [])
-            graph[task_id] = [str(d) for d in deps if str(d) in task_ids]
+        for task_id, task in zip(task_ids, tasks):
+            deps = (str(d) for d in task.get('dependencies', []))
+            graph[task_id] = [d for d in deps if d in known_ids]
+
+        return DependencyAnalyzer.find_cycles(graph)
+
+    @staticmethod
+    def find_cycles(graph: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Find cycles in a prebuilt dependency graph.
+        
+        Args:
+            graph: Mapping of task ID to the IDs it depends on; every
+                dependency must itself be a key of the graph
+        
+        Returns:
+            List of cycles found (each cycle is a list of task IDs)
+        """
+        # Kahn's algorithm: repeatedly drop nodes nothing depends on. Whatever
+        # survives lies on a cycle or downstream of one.
+        indegree = dict.fromkeys(graph, 0)
+        for deps in graph.values():
+            for dep in deps:
+                indegree[dep] += 1
+
+        queue = deque(node for node, degree in indegree.items() if degree == 0)
+        remaining = len(graph)
+        while queue:
+            node = queue.popleft()
+            remaining -= 1
+            for dep in graph[node]:
+                indegree[dep] -= 1
+                if indegree[dep] == 0:
+                    queue.append(dep)
+
+        if not remaining:
+            return []
 
         cycles = []
-        visited = set()
+        # Peeled nodes count as visited, so the DFS stays inside the residue
+        visited = {node for node, degree in indegree.items() if degree == 0}
         rec_stack = set()
         path = []
-
-        def dfs(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    if dfs(neighbor):
-                        return True
+        path_pos: Dict[str, int] = {}
+
+        for start in graph:
+            if start in visited:
+                continue
+
+            visited.add(start)
+            rec_stack.add(start)
+            path_pos[start] = len(path)
+            path.append(start)
+            stack = [(start, iter(graph[start]))]
+
+            while stack:
+                node, neighbors = stack[-1]
+                neighbor = next(neighbors, None)
+
+                if neighbor is None:
+                    stack.pop()
+                    path.pop()
+                    del path_pos[node]
+                    rec_stack.remove(node)
+                elif neighbor not in visited:
+                    visited.add(neighbor)
+                    rec_stack.add(neighbor)
+                    path_pos[neighbor] = len(path)
+                    path.append(neighbor)
+                    stack.append((neighbor, iter(graph[neighbor])))
                 elif neighbor in rec_stack:
-                    # Found cycle - extract it
-                    cycle_start = path.index(neighbor)
-                    cycle = path[cycle_start:] + [neighbor]
-                    cycles.append(cycle)
-                    return False  # Continue to find more cycles
-
-            path.pop()
-            rec_stack.remove(node)
-            return False
-
-        for task_id in graph:
-            if task_id not in visited:
-                dfs(task_id)
+                    # Found cycle - extract it and keep searching
+                    cycles.append(path[path_pos[neighbor]:] + [neighbor])
 
         return cycles
 
@@ -200,30 +304,136 @@ class DependencyAnalyzer:
         Count how many tasks depend on a given task (directly or indirectly).
         
         A task with many dependents should be prioritized higher.
+        For a whole batch, prefer blocking_counts_all.
         """
-        dependents = set()
-        
-        # Find direct dependents
-        for task in all_tasks:
-            deps = [str(d) for d in task.get('dependencies', [])]
-            if task_id in deps:
-                dependent_id = str(task.get('id', all_tasks.index(task)))
-                dependents.add(dependent_id)
+        reverse = build_reverse_graph(all_tasks)
+        dependents = set(reverse.get(task_id, ()))
 
-        # BFS to find indirect dependents
-        queue = list(dependents)
+        # BFS over the reverse index to find indirect dependents
+        queue = deque(dependents)
         while queue:
-            current = queue.pop(0)
-            for task in all_tasks:
-                deps = [str(d) for d in task.get('dependencies', [])]
-                if current in deps:
-                    dependent_id = str(task.get('id', all_tasks.index(task)))
-                    if dependent_id not in dependents:
-                        dependents.add(dependent_id)
-                        queue.append(dependent_id)
+            current = queue.popleft()
+            for dependent_id in reverse.get(current, ()):
+                if dependent_id not in dependents:
+                    dependents.add(dependent_id)
+                    queue.append(dependent_id)
 
         return len(dependents)
 
+    @staticmethod
+    def blocking_counts_all(tasks: List[Dict]) -> Dict[str, int]:
+        """
+        Count the direct and indirect dependents of every task in one pass.
+        
+        Returns:
+            Dictionary mapping task ID to its number of dependents; tasks
+            nothing depends on may be absent
+        """
+        return compute_blocking_counts(build_reverse_graph(tasks))
+
+
+def build_reverse_graph(tasks: List[Dict]) -> Dict[str, Set[str]]:
+    """
+    Build a reverse dependency graph mapping each task ID to the IDs of
+    the tasks that directly depend on it.
+    """
+    rgraph: Dict[str, Set[str]] = defaultdict(set)
+    for i, task in enumerate(tasks):
+        task_id = str(task.get('id', i))
+        for dep in task.get('dependencies', []):
+            rgraph[str(dep)].add(task_id)
+    return rgraph
+
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(mask: int) -> int:
+        return bin(mask).count('1')
+
+
+def compute_blocking_counts(rgraph: Dict[str, Set[str]]) -> Dict[str, int]:
+    """
+    Count the direct and indirect dependents of every node in a reverse
+    dependency graph in a single pass.
+    
+    Reachable sets are memoized as int bitmasks (one bit per node) and merged
+    in reverse topological order, so each edge is walked once and memory stays
+    around V²/8 bytes. Nodes on or downstream of a cycle cannot be ordered and
+    fall back to a plain BFS.
+    
+    Returns:
+        Dictionary mapping task ID to its number of dependents
+    """
+    nodes = set(rgraph)
+    for dependents in rgraph.values():
+        nodes.update(dependents)
+
+    indegree = dict.fromkeys(nodes, 0)
+    for dependents in rgraph.values():
+        for dependent in dependents:
+            indegree[dependent] += 1
+
+    # Kahn's algorithm over the reverse graph
+    queue = deque(node for node in nodes if indegree[node] == 0)
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for dependent in rgraph.get(node, ()):
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                queue.append(dependent)
+
+    bits = {node: 1 << i for i, node in enumerate(nodes)}
+    reachable: Dict[str, int] = {}
+
+    # Cyclic residue: explore each node directly
+    if len(order) < len(nodes):
+        ordered = set(order)
+        for node in nodes - ordered:
+            seen = set()
+            stack = list(rgraph.get(node, ()))
+            while stack:
+                current = stack.pop()
+                if current not in seen:
+                    seen.add(current)
+                    stack.extend(rgraph.get(current, ()))
+            mask = 0
+            for current in seen:
+                mask |= bits[current]
+            reachable[node] = mask
+
+    for node in reversed(order):
+        mask = 0
+        for dependent in rgraph.get(node, ()):
+            mask |= bits[dependent] | reachable[dependent]
+        reachable[node] = mask
+
+    return {node: _popcount(mask) for node, mask in reachable.items()}
+
+
+# Urgency for tasks not yet overdue: _URGENCY_SCORES[i] applies while
+# days_until_due < _URGENCY_THRESHOLDS[i] (today, tomorrow, 3, 7, 14, 30 days)
+_URGENCY_THRESHOLDS = (1, 2, 4, 8, 15, 31)
+_URGENCY_SCORES = (95.0, 85.0, 75.0, 60.0, 40.0, 25.0, 10.0)
+
+
+def _urgency_from_days(days_until_due: Optional[int]) -> float:
+    """Map days until the due date (None when unset) to an urgency score."""
+    if days_until_due is None:
+        return 30.0
+    if days_until_due < 0:
+        return min(150.0, 100.0 + (-days_until_due * 5))
+    return _URGENCY_SCORES[bisect_right(_URGENCY_THRESHOLDS, days_until_due)]
+
+
+def _effort_from_hours(estimated_hours: float) -> float:
+    """Map estimated hours to an effort score on an inverse log scale."""
+    if estimated_hours <= 0:
+        estimated_hours = 0.5
+    return max(5.0, min(100.0, 100 - (log2(estimated_hours + 1) * 20)))
+
 
 class PriorityScorer:
     """
@@ -235,10 +445,12 @@ class PriorityScorer:
     - Effort: Inverse of time required (quick wins concept)
     - Dependencies: How many other tasks this task unblocks
     """
+    __slots__ = ('strategy', 'weights', 'weight_vector')
 
     def __init__(self, strategy: SortingStrategy = SortingStrategy.SMART_BALANCE):
         self.strategy = strategy
-        self.weights = STRATEGY_WEIGHTS[strategy].normalize()
+        self.weights = NORMALIZED_WEIGHTS[strategy]
+        self.weight_vector = WEIGHT_VECTORS[strategy]
 
     def calculate_urgency_score(self, due_date: Optional[date], today: Optional[date] = None) -> Tuple[float, str]:
         """
@@ -265,26 +477,25 @@ class PriorityScorer:
             return 30.0, "No due date set - moderate priority"
 
         days_until_due = (due_date - today).days
+        score = _urgency_from_days(days_until_due)
 
         if days_until_due < 0:
             # Overdue - high urgency
-            days_overdue = abs(days_until_due)
-            score = min(150.0, 100.0 + (days_overdue * 5))
-            return score, f"OVERDUE by {days_overdue} day(s) - critical priority"
+            return score, f"OVERDUE by {-days_until_due} day(s) - critical priority"
         elif days_until_due == 0:
-            return 95.0, "Due TODAY - very high urgency"
+            return score, "Due TODAY - very high urgency"
         elif days_until_due == 1:
-            return 85.0, "Due TOMORROW - high urgency"
+            return score, "Due TOMORROW - high urgency"
         elif days_until_due <= 3:
-            return 75.0, f"Due in {days_until_due} days - urgent"
+            return score, f"Due in {days_until_due} days - urgent"
         elif days_until_due <= 7:
-            return 60.0, f"Due in {days_until_due} days - approaching deadline"
+            return score, f"Due in {days_until_due} days - approaching deadline"
         elif days_until_due <= 14:
-            return 40.0, f"Due in {days_until_due} days - moderate urgency"
+            return score, f"Due in {days_until_due} days - moderate urgency"
         elif days_until_due <= 30:
-            return 25.0, f"Due in {days_until_due} days - low urgency"
+            return score, f"Due in {days_until_due} days - low urgency"
         else:
-            return 10.0, f"Due in {days_until_due} days - not urgent"
+            return score, f"Due in {days_until_due} days - not urgent"
 
     def calculate_importance_score(self, importance: int) -> Tuple[float, str]:
         """
@@ -328,15 +539,13 @@ class PriorityScorer:
         Returns:
             Tuple of (score, explanation)
         """
-        import math
-        
         # Inverse logarithmic scale
         if estimated_hours <= 0:
             estimated_hours = 0.5
         
         # Score decreases as hours increase
-        # Formula: 100 - (log2(hours + 1) * 15), bounded [5, 100]
-        score = max(5.0, min(100.0, 100 - (math.log2(estimated_hours + 1) * 20)))
+        # Formula: 100 - (log2(hours + 1) * 20), bounded [5, 100]
+        score = _effort_from_hours(estimated_hours)
         
         if estimated_hours < 1:
             level = "Quick win - under 1 hour"
@@ -351,17 +560,18 @@ class PriorityScorer:
         
         return score, level
 
-    def calculate_dependency_score(self, task_id: str, all_tasks: List[Dict]) -> Tuple[float, str]:
+    def calculate_dependency_score(self, blocking_count: int) -> Tuple[float, str]:
         """
         Calculate dependency score based on how many tasks this unblocks.
         
         Tasks that block many other tasks get higher scores.
         
+        Args:
+            blocking_count: Precomputed number of direct and indirect dependents
+        
         Returns:
             Tuple of (score, explanation)
         """
-        blocking_count = DependencyAnalyzer.count_blocking_tasks(task_id, all_tasks)
-        
         # Score increases with number of dependent tasks
         # Cap at 100 for tasks blocking 5+ tasks
         score = min(100.0, blocking_count * 20.0)
@@ -375,44 +585,23 @@ class PriorityScorer:
         
         return score, explanation
 
-    def calculate_priority_score(
-        self, 
-        task: Dict[str, Any], 
-        all_tasks: List[Dict],
-        task_index: int
-    ) -> Dict[str, Any]:
+    def build_explanations(
+        self,
+        task: Dict[str, Any],
+        component_scores: Tuple[float, float, float, float],
+        blocking_count: int,
+        today: Optional[date] = None
+    ) -> Dict[str, str]:
         """
-        Calculate the complete priority score for a task.
+        Build the human-readable explanations for a scored task.
         
-        Returns a dictionary with:
-        - priority_score: Final weighted score
-        - component_scores: Individual factor scores
-        - explanations: Human-readable explanations
-        - strategy: The scoring strategy used
+        Returns a dictionary with one explanation per factor plus a summary.
         """
-        task_id = str(task.get('id', task_index))
-        
-        # Calculate individual component scores
-        urgency_score, urgency_explanation = self.calculate_urgency_score(
-            task.get('due_date')
-        )
-        importance_score, importance_explanation = self.calculate_importance_score(
-            task.get('importance', 5)
-        )
-        effort_score, effort_explanation = self.calculate_effort_score(
-            task.get('estimated_hours', 1)
-        )
-        dependency_score, dependency_explanation = self.calculate_dependency_score(
-            task_id, all_tasks
-        )
-        
-        # Calculate weighted final score
-        final_score = (
-            (urgency_score * self.weights.urgency) +
-            (importance_score * self.weights.importance) +
-            (effort_score * self.weights.effort) +
-            (dependency_score * self.weights.dependency)
-        )
+        _, urgency_explanation = self.calculate_urgency_score(task.get('due_date'), today)
+        _, importance_explanation = self.calculate_importance_score(task.get('importance', 5))
+        _, effort_explanation = self.calculate_effort_score(task.get('estimated_hours', 1))
+        _, dependency_explanation = self.calculate_dependency_score(blocking_count)
+        urgency_score, importance_score, effort_score, dependency_score = component_scores
         
         # Build explanation summary
         primary_factors = []
@@ -431,33 +620,132 @@ class PriorityScorer:
             summary = "Standard priority - balanced factors"
         
         return {
-            'priority_score': round(final_score, 2),
-            'component_scores': {
-                'urgency': round(urgency_score, 2),
-                'importance': round(importance_score, 2),
-                'effort': round(effort_score, 2),
-                'dependency': round(dependency_score, 2),
-            },
-            'explanations': {
-                'urgency': urgency_explanation,
-                'importance': importance_explanation,
-                'effort': effort_explanation,
-                'dependency': dependency_explanation,
-                'summary': summary,
-            },
-            'weights_used': {
-                'urgency': round(self.weights.urgency, 2),
-                'importance': round(self.weights.importance, 2),
-                'effort': round(self.weights.effort, 2),
-                'dependency': round(self.weights.dependency, 2),
-            },
+            'urgency': urgency_explanation,
+            'importance': importance_explanation,
+            'effort': effort_explanation,
+            'dependency': dependency_explanation,
+            'summary': summary,
+        }
+
+    def build_result(
+        self,
+        component_scores: Tuple[float, float, float, float],
+        priority_score: float,
+        explanations: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Combine component scores and their weighted priority score (as
+        computed by _score_batch) into a result.
+        
+        The explanations key is only included when explanations are given.
+        """
+        result = {
+            'priority_score': priority_score,
+            'component_scores': _component_scores_dict(component_scores),
+            'weights_used': dict(WEIGHTS_USED[self.strategy]),
             'strategy': self.strategy.value,
         }
+        if explanations is not None:
+            result['explanations'] = explanations
+        return result
+
+    def calculate_priority_score(
+        self, 
+        task: Dict[str, Any], 
+        all_tasks: Optional[List[Dict]] = None,
+        task_index: int = 0,
+        blocking_count: Optional[int] = None,
+        today: Optional[date] = None,
+        include_explanations: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Calculate the complete priority score for a task.
+        
+        Returns a dictionary with:
+        - priority_score: Final weighted score
+        - component_scores: Individual factor scores
+        - explanations: Human-readable explanations (if include_explanations)
+        - strategy: The scoring strategy used
+        
+        When blocking_count is not supplied it is derived from all_tasks.
+        """
+        if blocking_count is None:
+            task_id = str(task.get('id', task_index))
+            blocking_count = DependencyAnalyzer.count_blocking_tasks(task_id, all_tasks or [])
+        if today is None:
+            today = date.today()
+        
+        due_date = task.get('due_date')
+        batch_scores, priority_scores = _score_batch(
+            [(due_date - today).days if due_date else None],
+            [task.get('importance', 5)],
+            [task.get('estimated_hours', 1)],
+            [blocking_count],
+            self.weight_vector,
+        )
+        component_scores = batch_scores[0]
+        priority_score = priority_scores[0]
+        if not include_explanations:
+            return self.build_result(component_scores, priority_score)
+        explanations = self.build_explanations(task, component_scores, blocking_count, today)
+        return self.build_result(component_scores, priority_score, explanations)
+
+
+# Scorers hold no per-request state, so one per strategy is shared by all requests
+_SCORERS: Dict[SortingStrategy, PriorityScorer] = {
+    strategy: PriorityScorer(strategy) for strategy in SortingStrategy
+}
+
+
+def _component_scores_dict(component_scores: Tuple[float, float, float, float]) -> Dict[str, float]:
+    """Convert a component score tuple into its rounded response form."""
+    urgency_score, importance_score, effort_score, dependency_score = component_scores
+    return {
+        # Urgency and dependency scores are whole numbers already
+        'urgency': urgency_score,
+        'importance': round(importance_score, 2),
+        'effort': round(effort_score, 2),
+        'dependency': dependency_score,
+    }
+
+
+def _score_batch(
+    days_until_due: List[Optional[int]],
+    importance: List[int],
+    estimated_hours: List[float],
+    blocking_counts: List[int],
+    weight_vector: Tuple[float, float, float, float]
+) -> Tuple[List[Tuple[float, float, float, float]], List[float]]:
+    """
+    Calculate the component and priority scores for a batch of tasks.
+    
+    Each factor is computed as one column over the whole batch rather than
+    through the per-task scorer methods, and no explanation text is built.
+    All list arguments are parallel lists with one entry per task.
+    
+    Returns:
+        Tuple of (list of (urgency, importance, effort, dependency) tuples,
+        list of rounded priority scores)
+    """
+    urgency = [_urgency_from_days(days) for days in days_until_due]
+    importance = [value * 10.0 for value in importance]
+    effort = [_effort_from_hours(hours) for hours in estimated_hours]
+    dependency = [min(100.0, count * 20.0) for count in blocking_counts]
+    
+    w_urgency, w_importance, w_effort, w_dependency = weight_vector
+    priority_scores = [
+        round(u * w_urgency + i * w_importance + e * w_effort + d * w_dependency, 2)
+        for u, i, e, d in zip(urgency, importance, effort, dependency)
+    ]
+    return list(zip(urgency, importance, effort, dependency)), priority_scores
 
 
 def analyze_tasks(
     tasks: List[Dict[str, Any]], 
-    strategy: str = "smart_balance"
+    strategy: str = "smart_balance",
+    include_explanations: bool = True,
+    trusted: bool = False,
+    today: Optional[date] = None
 ) -> Dict[str, Any]:
     """
     Main entry point for task analysis.
@@ -468,6 +756,9 @@ def analyze_tasks(
     Args:
         tasks: List of task dictionaries
         strategy: Sorting strategy name
+        include_explanations: Whether to attach explanations to each task
+        trusted: Tasks were already validated by TaskSerializer
+        today: Reference date for urgency (defaults to date.today())
     
     Returns:
         Dictionary with analyzed results, including:
@@ -475,6 +766,24 @@ def analyze_tasks(
         - circular_dependencies: Any detected cycles
         - validation_errors: Any validation issues
         - strategy_used: The scoring strategy applied
+        - weights_used: The normalized weights of that strategy, shared by
+          every task in the result
+    """
+    return _analyze(tasks, strategy, None if include_explanations else 0, trusted, today)
+
+
+def _analyze(
+    tasks: List[Dict[str, Any]],
+    strategy: str,
+    explain_limit: Optional[int],
+    trusted: bool = False,
+    today: Optional[date] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Analyze tasks, building explanations only for the top explain_limit
+    ranked tasks (all of them when None). When limit is given, only the top
+    limit tasks are ranked and returned; total_tasks still counts them all.
     """
     # Parse strategy
     try:
@@ -482,15 +791,25 @@ def analyze_tasks(
     except ValueError:
         sort_strategy = SortingStrategy.SMART_BALANCE
 
-    scorer = PriorityScorer(sort_strategy)
-    validator = TaskValidator()
+    scorer = _SCORERS[sort_strategy]
+    validate_task = TaskValidator.validate_task
     
-    # Validate and sanitize all tasks
+    if today is None:
+        today = date.today()
     validated_tasks = []
     validation_errors = []
     
+    # Columns derived from each task while it is validated
+    task_ids = []
+    task_deps = []
+    reverse_graph: Dict[str, Set[str]] = defaultdict(set)
+    days_until_due = []
+    importance = []
+    estimated_hours = []
+    
+    # Validate, sanitize and extract scoring inputs in a single pass
     for i, task in enumerate(tasks):
-        is_valid, errors, sanitized = validator.validate_task(task)
+        is_valid, errors, sanitized = validate_task(task, trusted)
         if not is_valid:
             validation_errors.append({
                 'task_index': i,
@@ -499,49 +818,92 @@ def analyze_tasks(
             })
         sanitized['original_index'] = i
         validated_tasks.append(sanitized)
+        
+        task_id = str(sanitized.get('id', i))
+        dep_ids = [str(d) for d in sanitized['dependencies']]
+        for dep_id in dep_ids:
+            reverse_graph[dep_id].add(task_id)
+        task_ids.append(task_id)
+        task_deps.append(dep_ids)
+        
+        due_date = sanitized['due_date']
+        days_until_due.append((due_date - today).days if due_date else None)
+        importance.append(sanitized['importance'])
+        estimated_hours.append(sanitized['estimated_hours'])
+    
+    # Detect circular dependencies (impossible when nothing has dependencies)
+    circular_deps = []
+    if reverse_graph:
+        known_ids = set(task_ids)
+        graph = {
+            task_id: [d for d in deps if d in known_ids]
+            for task_id, deps in zip(task_ids, task_deps)
+        }
+        circular_deps = DependencyAnalyzer.find_cycles(graph)
     
-    # Detect circular dependencies
-    circular_deps = DependencyAnalyzer.detect_circular_dependencies(validated_tasks)
+    # Count dependents for every task in one pass over the graph
+    blocking_by_id = compute_blocking_counts(reverse_graph)
+    blocking_counts = [blocking_by_id.get(task_id, 0) for task_id in task_ids]
     
     # Calculate priority scores for all tasks
+    # One copy per analysis, shared by its rows and the top-level result
+    weights_used = dict(WEIGHTS_USED[sort_strategy])
+    component_scores, priority_scores = _score_batch(
+        days_until_due, importance, estimated_hours, blocking_counts, scorer.weight_vector
+    )
+    
+    # Sort task indices by priority score (descending, stable for ties); a
+    # partial sort is enough when only the top few are wanted
+    indices = range(len(priority_scores))
+    if limit is None:
+        ranked = sorted(indices, key=priority_scores.__getitem__, reverse=True)
+    else:
+        ranked = nlargest(limit, indices, key=priority_scores.__getitem__)
+    
+    # Build result rows in rank order, explaining only the tasks that will be shown
     scored_tasks = []
-    for i, task in enumerate(validated_tasks):
-        score_result = scorer.calculate_priority_score(task, validated_tasks, i)
-        
+    iso_dates: Dict[date, str] = {}
+    for rank, index in enumerate(ranked, 1):
+        task = validated_tasks[index]
         scored_task = {
             **task,
-            'priority_score': score_result['priority_score'],
-            'component_scores': score_result['component_scores'],
-            'explanations': score_result['explanations'],
-            'weights_used': score_result['weights_used'],
+            'priority_score': priority_scores[index],
+            'component_scores': _component_scores_dict(component_scores[index]),
+            'weights_used': weights_used,
         }
         
-        # Convert date back to string for JSON serialization
-        if scored_task.get('due_date'):
-            scored_task['due_date'] = scored_task['due_date'].isoformat()
-        
+        # Convert date back to string for JSON serialization; deadlines are
+        # often shared, so format each distinct date once
+        due_date = scored_task.get('due_date')
+        if due_date:
+            iso_date = iso_dates.get(due_date)
+            if iso_date is None:
+                iso_date = iso_dates[due_date] = due_date.isoformat()
+            scored_task['due_date'] = iso_date
+        
+        if explain_limit is None or rank <= explain_limit:
+            scored_task['explanations'] = scorer.build_explanations(
+                task, component_scores[index], blocking_counts[index], today
+            )
+        scored_task['rank'] = rank
         scored_tasks.append(scored_task)
     
-    # Sort by priority score (descending)
-    scored_tasks.sort(key=lambda x: x['priority_score'], reverse=True)
-    
-    # Add rank
-    for rank, task in enumerate(scored_tasks, 1):
-        task['rank'] = rank
-    
     return {
         'tasks': scored_tasks,
         'circular_dependencies': circular_deps,
         'validation_errors': validation_errors,
         'strategy_used': sort_strategy.value,
-        'total_tasks': len(scored_tasks),
+        'weights_used': weights_used,
+        'total_tasks': len(validated_tasks),
     }
 
 
 def suggest_tasks(
     tasks: List[Dict[str, Any]], 
     count: int = 3,
-    strategy: str = "smart_balance"
+    strategy: str = "smart_balance",
+    trusted: bool = False,
+    today: Optional[date] = None
 ) -> Dict[str, Any]:
     """
     Suggest the top N tasks to work on today with detailed explanations.
@@ -550,16 +912,19 @@ def suggest_tasks(
         tasks: List of task dictionaries
         count: Number of tasks to suggest (default 3)
         strategy: Sorting strategy name
+        trusted: Tasks were already validated by TaskSerializer
+        today: Reference date for urgency (defaults to date.today())
     
     Returns:
         Dictionary with top suggested tasks and reasoning
     """
-    analysis = analyze_tasks(tasks, strategy)
+    analysis = _analyze(
+        tasks, strategy, explain_limit=count, trusted=trusted, today=today, limit=count
+    )
     
-    top_tasks = analysis['tasks'][:count]
     suggestions = []
     
-    for i, task in enumerate(top_tasks, 1):
+    for i, task in enumerate(analysis['tasks'], 1):
         # Build detailed recommendation
         reasons = []
         scores = task['component_scores']
@@ -4,19 +4,25 @@ Unit tests for the Smart Task Analyzer scoring algorithm.
 Run with: python manage.py test tasks
 """
 
+import json
 from datetime import date, timedelta
-from django.test import TestCase
+from unittest.mock import AsyncMock, patch
+from django.test import SimpleTestCase
 from .scoring import (
     PriorityScorer, 
     TaskValidator, 
     DependencyAnalyzer,
     SortingStrategy,
+    build_reverse_graph,
+    compute_blocking_counts,
     analyze_tasks,
     suggest_tasks
 )
+from .serializers import AnalyzeRequestSerializer
+from . import views
 
 
-class TestTaskValidator(TestCase):
+class TestTaskValidator(SimpleTestCase):
     """Tests for task validation logic."""
     
     def test_valid_task(self):
@@ -74,7 +80,7 @@ class TestTaskValidator(TestCase):
         self.assertTrue(any('positive' in e for e in errors))
 
 
-class TestDependencyAnalyzer(TestCase):
+class TestDependencyAnalyzer(SimpleTestCase):
     """Tests for dependency analysis logic."""
     
     def test_no_circular_dependencies(self):
@@ -106,6 +112,37 @@ class TestDependencyAnalyzer(TestCase):
         cycles = DependencyAnalyzer.detect_circular_dependencies(tasks)
         self.assertGreater(len(cycles), 0)
     
+    def test_deep_dependency_chain(self):
+        """Test that long chains don't hit the recursion limit."""
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'dependencies': [i + 1]}
+            for i in range(5000)
+        ]
+        tasks.append({'id': 5000, 'title': 'Task 5000', 'dependencies': [0]})
+        
+        cycles = DependencyAnalyzer.detect_circular_dependencies(tasks)
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(len(cycles[0]), 5002)
+    
+    def test_cycle_reached_through_acyclic_tasks(self):
+        """Test that only the tasks on a cycle are reported."""
+        tasks = [
+            {'id': 1, 'title': 'Task 1', 'dependencies': [2]},
+            {'id': 2, 'title': 'Task 2', 'dependencies': [3]},
+            {'id': 3, 'title': 'Task 3', 'dependencies': [4]},
+            {'id': 4, 'title': 'Task 4', 'dependencies': [3, 5]},
+            {'id': 5, 'title': 'Task 5', 'dependencies': []},
+        ]
+        cycles = DependencyAnalyzer.detect_circular_dependencies(tasks)
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(set(cycles[0]), {'3', '4'})
+    
+    def test_self_dependency_in_single_task(self):
+        """Test that a lone task depending on itself is a cycle."""
+        tasks = [{'id': 1, 'title': 'Task 1', 'dependencies': [1]}]
+        result = analyze_tasks(tasks)
+        self.assertEqual(result['circular_dependencies'], [['1', '1']])
+    
     def test_blocking_count(self):
         """Test counting of tasks that depend on a given task."""
         tasks = [
@@ -126,9 +163,47 @@ class TestDependencyAnalyzer(TestCase):
         # Task 4 blocks nothing
         count = DependencyAnalyzer.count_blocking_tasks('4', tasks)
         self.assertEqual(count, 0)
+    
+    def test_tasks_without_ids_use_position(self):
+        """Test that tasks lacking an id are referenced by list position."""
+        tasks = [
+            {'title': 'Task 0', 'dependencies': []},
+            {'title': 'Task 1', 'dependencies': [0]},
+            {'title': 'Task 2', 'dependencies': [1]},
+        ]
+        self.assertEqual(DependencyAnalyzer.count_blocking_tasks('0', tasks), 2)
+        self.assertEqual(compute_blocking_counts(build_reverse_graph(tasks))['1'], 1)
+        
+        tasks[0]['dependencies'] = [2]
+        cycles = DependencyAnalyzer.detect_circular_dependencies(tasks)
+        self.assertEqual(len(cycles), 1)
+    
+    def test_blocking_counts_for_all_tasks(self):
+        """Test that batch blocking counts match per-task counting, including cycles."""
+        tasks = [
+            {'id': 1, 'title': 'Task 1', 'dependencies': []},
+            {'id': 2, 'title': 'Task 2', 'dependencies': [1, 4]},
+            {'id': 3, 'title': 'Task 3', 'dependencies': [2]},
+            {'id': 4, 'title': 'Task 4', 'dependencies': [3]},
+            {'id': 5, 'title': 'Task 5', 'dependencies': [4]},
+        ]
+        counts = DependencyAnalyzer.blocking_counts_all(tasks)
+        
+        self.assertEqual(counts['1'], 4)
+        self.assertEqual(counts['2'], 4)  # cycle 2->3->4->2 includes itself
+        self.assertEqual(counts['3'], 4)
+        self.assertEqual(counts['4'], 4)
+        self.assertEqual(counts.get('5', 0), 0)
+        self.assertEqual(counts, compute_blocking_counts(build_reverse_graph(tasks)))
+        for task in tasks:
+            task_id = str(task['id'])
+            self.assertEqual(
+                counts.get(task_id, 0),
+                DependencyAnalyzer.count_blocking_tasks(task_id, tasks)
+            )
 
 
-class TestPriorityScorer(TestCase):
+class TestPriorityScorer(SimpleTestCase):
     """Tests for the priority scoring algorithm."""
     
     def setUp(self):
@@ -182,9 +257,28 @@ class TestPriorityScorer(TestCase):
         """Test that large tasks get lower effort scores."""
         score, _ = self.scorer.calculate_effort_score(40)  # 40 hours
         self.assertLess(score, 30)
+    
+    def test_calculate_priority_score(self):
+        """Test the full score for a single task, with and without explanations."""
+        task = {'id': 1, 'title': 'Task', 'due_date': self.today, 'importance': 8, 'estimated_hours': 1}
+        all_tasks = [task, {'id': 2, 'title': 'Blocked', 'dependencies': [1]}]
+        
+        # Urgency 95, importance 80, effort 80, no dependents
+        result = self.scorer.calculate_priority_score(task, blocking_count=0, today=self.today)
+        self.assertEqual(result['priority_score'], 68.5)
+        self.assertEqual(result['component_scores']['dependency'], 0.0)
+        self.assertIn('explanations', result)
+        
+        # One dependent derived from all_tasks adds a 20 point dependency score
+        result = self.scorer.calculate_priority_score(
+            task, all_tasks, today=self.today, include_explanations=False
+        )
+        self.assertEqual(result['priority_score'], 72.5)
+        self.assertEqual(result['component_scores']['dependency'], 20.0)
+        self.assertNotIn('explanations', result)
 
 
-class TestAnalyzeTasks(TestCase):
+class TestAnalyzeTasks(SimpleTestCase):
     """Integration tests for the main analyze_tasks function."""
     
     def test_tasks_sorted_by_priority(self):
@@ -244,9 +338,70 @@ class TestAnalyzeTasks(TestCase):
         # Fastest wins should favor quick task
         fastest = analyze_tasks(tasks, 'fastest_wins')
         self.assertEqual(fastest['tasks'][0]['title'], 'Quick but less important')
+    
+    def test_weights_reported_once_per_analysis(self):
+        """Test that all tasks share the top-level weights of the strategy."""
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'importance': i + 1}
+            for i in range(3)
+        ]
+        result = analyze_tasks(tasks, 'high_impact')
+        
+        self.assertAlmostEqual(sum(result['weights_used'].values()), 1.0)
+        for task in result['tasks']:
+            self.assertEqual(task['weights_used'], result['weights_used'])
+    
+    def test_mutating_weights_does_not_leak_between_calls(self):
+        """Test that editing one result's weights leaves later results untouched."""
+        tasks = [{'id': 1, 'title': 'Task'}]
+        first = analyze_tasks(tasks)
+        expected = dict(first['weights_used'])
+        first['weights_used']['urgency'] = 99
+        
+        self.assertEqual(analyze_tasks(tasks)['weights_used'], expected)
+        
+        scorer = PriorityScorer(SortingStrategy.SMART_BALANCE)
+        result = scorer.calculate_priority_score(tasks[0], blocking_count=0)
+        result['weights_used']['urgency'] = 99
+        self.assertEqual(scorer.calculate_priority_score(tasks[0], blocking_count=0)['weights_used'], expected)
+    
+    def test_trusted_tasks_match_full_validation(self):
+        """Test that serializer-validated tasks score the same without re-validation."""
+        today = date.today()
+        serializer = AnalyzeRequestSerializer(data={'tasks': [
+            {'id': 1, 'title': ' Ship release ', 'due_date': today.isoformat(), 'importance': 8},
+            {'id': 2, 'title': 'Write notes', 'estimated_hours': 0.5, 'dependencies': [1]},
+        ]})
+        self.assertTrue(serializer.is_valid())
+        tasks = serializer.validated_data['tasks']
+        
+        self.assertEqual(
+            analyze_tasks(tasks, trusted=True),
+            analyze_tasks(tasks, trusted=False)
+        )
+    
+    def test_reference_date_can_be_supplied(self):
+        """Test that urgency is measured from the given reference date."""
+        tasks = [{'id': 1, 'title': 'Task', 'due_date': '2025-01-10'}]
+        
+        result = analyze_tasks(tasks, today=date(2025, 1, 10))
+        self.assertEqual(result['tasks'][0]['component_scores']['urgency'], 95.0)
+        
+        result = suggest_tasks(tasks, count=1, today=date(2025, 1, 11))
+        self.assertEqual(result['suggestions'][0]['component_scores']['urgency'], 105.0)
+    
+    def test_explanations_can_be_skipped(self):
+        """Test that explanations are only built when requested."""
+        tasks = [{'id': 1, 'title': 'Task 1', 'dependencies': []}]
+        
+        result = analyze_tasks(tasks, include_explanations=False)
+        self.assertNotIn('explanations', result['tasks'][0])
+        
+        result = analyze_tasks(tasks)
+        self.assertIn('summary', result['tasks'][0]['explanations'])
 
 
-class TestSuggestTasks(TestCase):
+class TestSuggestTasks(SimpleTestCase):
     """Tests for the suggest_tasks function."""
     
     def test_returns_requested_count(self):
@@ -262,6 +417,19 @@ class TestSuggestTasks(TestCase):
         result = suggest_tasks(tasks, count=5)
         self.assertEqual(len(result['suggestions']), 5)
     
+    def test_suggestions_match_full_ranking(self):
+        """Test that the top suggestions follow the full analysis order, ties included."""
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'importance': i % 4 + 1, 'estimated_hours': i % 3 + 1}
+            for i in range(20)
+        ]
+        
+        ranked = [t['id'] for t in analyze_tasks(tasks)['tasks'][:4]]
+        result = suggest_tasks(tasks, count=4)
+        
+        self.assertEqual([s['task']['id'] for s in result['suggestions']], ranked)
+        self.assertEqual(result['total_tasks_analyzed'], 20)
+    
     def test_suggestions_include_reasons(self):
         """Test that suggestions include explanatory reasons."""
         today = date.today()
@@ -279,3 +447,120 @@ class TestSuggestTasks(TestCase):
         self.assertIn('reasons', suggestion)
         self.assertIsInstance(suggestion['reasons'], list)
         self.assertGreater(len(suggestion['reasons']), 0)
+
+
+class TestApiViews(SimpleTestCase):
+    """Tests for the JSON API views."""
+    
+    def test_analyze_returns_sorted_tasks(self):
+        """Test that the analyze endpoint scores and ranks posted tasks."""
+        payload = {
+            'tasks': [
+                {'id': 1, 'title': 'Later', 'importance': 2},
+                {'id': 2, 'title': 'Now', 'due_date': date.today().isoformat(), 'importance': 9},
+            ],
+        }
+        response = self.client.post(
+            '/api/tasks/analyze/', json.dumps(payload), content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        result = response.json()
+        self.assertEqual([t['title'] for t in result['tasks']], ['Now', 'Later'])
+    
+    def test_repeat_analysis_served_consistently(self):
+        """Test that cached analyze responses match and are keyed by strategy."""
+        tasks = [
+            {'id': 1, 'title': 'Quick', 'estimated_hours': 0.5, 'importance': 3},
+            {'id': 2, 'title': 'Important', 'estimated_hours': 20, 'importance': 10},
+        ]
+        
+        def post(strategy):
+            return self.client.post(
+                '/api/tasks/analyze/',
+                json.dumps({'tasks': tasks, 'strategy': strategy}),
+                content_type='application/json'
+            ).json()
+        
+        self.assertEqual(post('fastest_wins'), post('fastest_wins'))
+        self.assertEqual(post('fastest_wins')['tasks'][0]['title'], 'Quick')
+        self.assertEqual(post('high_impact')['tasks'][0]['title'], 'Important')
+    
+    def test_analyze_cache_bounded_by_size(self):
+        """Test that oversized bodies are not cached and total cached bytes stay capped."""
+        payload = {'tasks': [{'id': 1, 'title': 'Too large to cache'}]}
+        with patch('tasks.views._ANALYZE_CACHE_MAX_BODY', 100):
+            before = dict(views._analyze_cache)
+            response = self.client.post(
+                '/api/tasks/analyze/', json.dumps(payload), content_type='application/json'
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(views._analyze_cache, before)
+        
+        with patch('tasks.views._ANALYZE_CACHE_MAX_BYTES', 250):
+            for i in range(5):
+                views._analyze_cache_put(f'size-test-{i}'.encode(), b'x' * 100)
+            self.assertLessEqual(views._analyze_cache_bytes, 250)
+            self.assertEqual(views._analyze_cache_bytes, sum(map(len, views._analyze_cache.values())))
+            self.assertIn(b'size-test-4', views._analyze_cache)
+            self.assertNotIn(b'size-test-2', views._analyze_cache)
+    
+    def test_invalid_json_rejected(self):
+        """Test that malformed bodies return a JSON error."""
+        response = self.client.post(
+            '/api/tasks/suggest/', '{not json', content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', response.json())
+    
+    def test_out_of_range_values_report_field_errors(self):
+        """Test that values rejected on the fast path get serializer errors."""
+        payload = {'tasks': [{'title': 'Task', 'importance': 15}]}
+        response = self.client.post(
+            '/api/tasks/analyze/', json.dumps(payload), content_type='application/json'
+        )
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('importance', response.json()['details']['tasks'][0])
+    
+    def test_unencodable_result_returns_json_error(self):
+        """Test that a result that cannot be encoded yields a JSON 500 response."""
+        payload = json.dumps({'tasks': [{'id': 1, 'title': 'Unencodable result'}]})
+        unencodable = AsyncMock(return_value={'tasks': [object()]})
+        
+        for url, target in (
+            ('/api/tasks/analyze/', 'tasks.views._analyze_tasks_async'),
+            ('/api/tasks/suggest/', 'tasks.views._suggest_tasks_async'),
+        ):
+            with patch(target, unencodable):
+                response = self.client.post(url, payload, content_type='application/json')
+            
+            self.assertEqual(response.status_code, 500)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertIn('error', response.json())
+    
+    def test_health_check_not_cached(self):
+        """Test that health responses tell caches not to store them."""
+        response = self.client.get('/api/health/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+    
+    def test_ids_beyond_64_bits_rejected(self):
+        """Test that task and dependency IDs outside the int64 range get field errors."""
+        for task in ({'id': 2 ** 70, 'title': 'Task'}, {'title': 'Task', 'dependencies': [-2 ** 63 - 1]}):
+            for url in ('/api/tasks/analyze/', '/api/tasks/suggest/'):
+                response = self.client.post(
+                    url, json.dumps({'tasks': [task]}), content_type='application/json'
+                )
+                
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('tasks', response.json()['details'])
+        
+        payload = {'tasks': [{'id': 2 ** 63 - 1, 'title': 'Task', 'dependencies': [-2 ** 63]}]}
+        response = self.client.post(
+            '/api/tasks/analyze/', json.dumps(payload), content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 200)
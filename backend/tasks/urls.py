@@ -5,6 +5,7 @@ URL configuration for the Tasks API.
 from django.urls import path
 from . import views
 
+# Ordered by expected request frequency
 urlpatterns = [
     path('tasks/analyze/', views.analyze_tasks_view, name='analyze_tasks'),
     path('tasks/suggest/', views.suggest_tasks_view, name='suggest_tasks'),
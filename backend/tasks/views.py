@@ -2,16 +2,206 @@
 API Views for the Smart Task Analyzer.
 """
 
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+
+import msgspec
+import orjson
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotAllowed
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_http_methods
 from rest_framework import status
 
 from .scoring import analyze_tasks, suggest_tasks
-from .serializers import AnalyzeRequestSerializer, SuggestRequestSerializer
+from .serializers import (
+    ANALYZE_REQUEST_DECODER,
+    SUGGEST_REQUEST_DECODER,
+    AnalyzeRequestSerializer,
+    SuggestRequestSerializer,
+    decode_request,
+)
+
+
+def _raw_json_response(body, status=status.HTTP_200_OK):
+    """Wrap an already encoded JSON body in an HttpResponse."""
+    return HttpResponse(body, status=status, content_type='application/json')
+
+
+# Static response bodies, encoded once at import
+_INVALID_JSON_BODY = orjson.dumps({
+    'error': 'Invalid request data',
+    'message': 'Request body must be valid JSON',
+})
+_ANALYZE_NO_TASKS_BODY = orjson.dumps({
+    'error': 'No tasks provided',
+    'message': 'Please provide at least one task to analyze'
+})
+_SUGGEST_NO_TASKS_BODY = orjson.dumps({
+    'error': 'No tasks provided',
+    'message': 'Please provide tasks in the request body'
+})
+_SUGGEST_USAGE_BODY = orjson.dumps({
+    'message': 'Please use POST with tasks in the request body',
+    'example': {
+        'tasks': [
+            {
+                'id': 1,
+                'title': 'Example task',
+                'due_date': '2025-11-30',
+                'estimated_hours': 2,
+                'importance': 7,
+                'dependencies': []
+            }
+        ],
+        'count': 3,
+        'strategy': 'smart_balance'
+    }
+})
+_ANALYZE_FAILED_BODY = orjson.dumps({
+    'error': 'Analysis failed',
+    'message': 'The tasks could not be analyzed'
+})
+_SUGGEST_FAILED_BODY = orjson.dumps({
+    'error': 'Suggestion generation failed',
+    'message': 'Suggestions could not be generated for these tasks'
+})
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'Smart Task Analyzer API',
+    'version': '1.0.0'
+})
+
+
+class ScoringError(Exception):
+    """
+    Raised when a scoring result cannot be turned into a response body.
+    http_status is the status the API should respond with.
+    """
+    http_status = 500
+
+
+def _encode_result(result):
+    """Encode a scoring result, raising ScoringError if it is not serializable."""
+    try:
+        return orjson.dumps(result)
+    except orjson.JSONEncodeError as e:
+        raise ScoringError(f"Result could not be encoded: {e}") from e
 
 
-@api_view(['POST'])
-def analyze_tasks_view(request):
+def _validate_request(request, decoder, serializer_class):
+    """
+    Validate a JSON request body.
+    
+    Well-formed bodies are decoded and checked by the msgspec fast path;
+    anything it rejects goes through the DRF serializer, which decides
+    whether the body is acceptable and reports structured errors.
+    
+    Returns:
+        Tuple of (validated_data, error_response); exactly one is None
+    """
+    body = request.body or b'{}'
+    try:
+        validated = decode_request(decoder, body)
+        if validated is not None:
+            return validated, None
+        data = orjson.loads(body)
+    except (msgspec.DecodeError, orjson.JSONDecodeError):
+        return None, _raw_json_response(_INVALID_JSON_BODY, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = serializer_class(data=data)
+    if not serializer.is_valid():
+        # List field errors are keyed by item index, so allow non-string keys
+        body = orjson.dumps({
+            'error': 'Invalid request data',
+            'details': serializer.errors
+        }, option=orjson.OPT_NON_STR_KEYS)
+        return None, _raw_json_response(body, status=status.HTTP_400_BAD_REQUEST)
+    return serializer.validated_data, None
+
+# Scoring is CPU-bound; run it on the thread pool so the event loop stays free
+_analyze_tasks_async = sync_to_async(analyze_tasks, thread_sensitive=False)
+_suggest_tasks_async = sync_to_async(suggest_tasks, thread_sensitive=False)
+
+
+# Serialized analyze responses keyed by a hash of the validated payload. The
+# cached bytes are immutable, so hits can be returned without copying. Both
+# the entry count and the total body size are capped, and bodies too large to
+# be worth pinning are not cached at all.
+_ANALYZE_CACHE_SIZE = 512
+_ANALYZE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_ANALYZE_CACHE_MAX_BODY = 256 * 1024
+_analyze_cache: 'OrderedDict[bytes, bytes]' = OrderedDict()
+_analyze_cache_bytes = 0
+_analyze_cache_lock = threading.Lock()
+
+
+def _analyze_cache_key(tasks, strategy, today):
+    """
+    Hash the canonical JSON form of an analyze request.
+    
+    The reference date is part of the key because urgency scores depend on it.
+    Integer fields must already be bounded to 64 bits (see TaskSerializer),
+    since orjson cannot encode wider integers.
+    """
+    payload = orjson.dumps((today, strategy, tasks), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _analyze_cache_get(key):
+    """Return the cached response body for key, or None."""
+    with _analyze_cache_lock:
+        body = _analyze_cache.get(key)
+        if body is not None:
+            _analyze_cache.move_to_end(key)
+        return body
+
+
+def _analyze_cache_put(key, body):
+    """
+    Store a response body, evicting least recently used entries until the
+    cache is back within its entry and byte limits.
+    """
+    global _analyze_cache_bytes
+    if len(body) > _ANALYZE_CACHE_MAX_BODY:
+        return
+    with _analyze_cache_lock:
+        previous = _analyze_cache.pop(key, None)
+        if previous is not None:
+            _analyze_cache_bytes -= len(previous)
+        _analyze_cache[key] = body
+        _analyze_cache_bytes += len(body)
+        while (len(_analyze_cache) > _ANALYZE_CACHE_SIZE
+               or _analyze_cache_bytes > _ANALYZE_CACHE_MAX_BYTES):
+            _, evicted = _analyze_cache.popitem(last=False)
+            _analyze_cache_bytes -= len(evicted)
+
+
+def _async_json_view(allowed_methods):
+    """
+    Restrict an async view to allowed_methods and exempt it from CSRF.
+    
+    Django 4.x's require_http_methods and csrf_exempt wrap views in plain
+    functions, which would hide the coroutine from the request handler.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in allowed_methods:
+                return HttpResponseNotAllowed(allowed_methods)
+            return await view(request, *args, **kwargs)
+
+        wrapper.csrf_exempt = True
+        return wrapper
+
+    return decorator
+
+
+@_async_json_view(['POST'])
+async def analyze_tasks_view(request):
     """
     POST /api/tasks/analyze/
     
@@ -39,38 +229,41 @@ def analyze_tasks_view(request):
         "circular_dependencies": [...],
         "validation_errors": [...],
         "strategy_used": "smart_balance",
+        "weights_used": {...},
         "total_tasks": 5
     }
     """
-    serializer = AnalyzeRequestSerializer(data=request.data)
-    
-    if not serializer.is_valid():
-        return Response({
-            'error': 'Invalid request data',
-            'details': serializer.errors
-        }, status=status.HTTP_400_BAD_REQUEST)
+    validated, error_response = _validate_request(
+        request, ANALYZE_REQUEST_DECODER, AnalyzeRequestSerializer
+    )
+    if error_response is not None:
+        return error_response
     
-    tasks = serializer.validated_data['tasks']
-    strategy = serializer.validated_data.get('strategy', 'smart_balance')
+    tasks = validated['tasks']
+    strategy = validated.get('strategy', 'smart_balance')
     
     if not tasks:
-        return Response({
-            'error': 'No tasks provided',
-            'message': 'Please provide at least one task to analyze'
-        }, status=status.HTTP_400_BAD_REQUEST)
+        return _raw_json_response(_ANALYZE_NO_TASKS_BODY, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        result = analyze_tasks(tasks, strategy)
-        return Response(result)
-    except Exception as e:
-        return Response({
-            'error': 'Analysis failed',
-            'message': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # One reference date per request, shared by the cache key and scoring
+    today = date.today()
+    
+    # Repeat submissions of the same task list are served from the cache
+    key = _analyze_cache_key(tasks, strategy, today)
+    body = _analyze_cache_get(key)
+    if body is None:
+        try:
+            result = await _analyze_tasks_async(tasks, strategy, trusted=True, today=today)
+            body = _encode_result(result)
+        except ScoringError as e:
+            return _raw_json_response(_ANALYZE_FAILED_BODY, status=e.http_status)
+        _analyze_cache_put(key, body)
+    
+    return _raw_json_response(body)
 
 
-@api_view(['GET', 'POST'])
-def suggest_tasks_view(request):
+@_async_json_view(['GET', 'POST'])
+async def suggest_tasks_view(request):
     """
     GET/POST /api/tasks/suggest/
     
@@ -107,61 +300,38 @@ def suggest_tasks_view(request):
     """
     if request.method == 'GET':
         # For GET requests, we need tasks in the database or return instructions
-        return Response({
-            'message': 'Please use POST with tasks in the request body',
-            'example': {
-                'tasks': [
-                    {
-                        'id': 1,
-                        'title': 'Example task',
-                        'due_date': '2025-11-30',
-                        'estimated_hours': 2,
-                        'importance': 7,
-                        'dependencies': []
-                    }
-                ],
-                'count': 3,
-                'strategy': 'smart_balance'
-            }
-        })
+        return _raw_json_response(_SUGGEST_USAGE_BODY)
     
-    serializer = SuggestRequestSerializer(data=request.data)
+    validated, error_response = _validate_request(
+        request, SUGGEST_REQUEST_DECODER, SuggestRequestSerializer
+    )
+    if error_response is not None:
+        return error_response
     
-    if not serializer.is_valid():
-        return Response({
-            'error': 'Invalid request data',
-            'details': serializer.errors
-        }, status=status.HTTP_400_BAD_REQUEST)
-    
-    tasks = serializer.validated_data.get('tasks', [])
-    count = serializer.validated_data.get('count', 3)
-    strategy = serializer.validated_data.get('strategy', 'smart_balance')
+    tasks = validated.get('tasks', [])
+    count = validated.get('count', 3)
+    strategy = validated.get('strategy', 'smart_balance')
     
     if not tasks:
-        return Response({
-            'error': 'No tasks provided',
-            'message': 'Please provide tasks in the request body'
-        }, status=status.HTTP_400_BAD_REQUEST)
+        return _raw_json_response(_SUGGEST_NO_TASKS_BODY, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        result = suggest_tasks(tasks, count, strategy)
-        return Response(result)
-    except Exception as e:
-        return Response({
-            'error': 'Suggestion generation failed',
-            'message': str(e)
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        result = await _suggest_tasks_async(
+            tasks, count, strategy, trusted=True, today=date.today()
+        )
+        body = _encode_result(result)
+    except ScoringError as e:
+        return _raw_json_response(_SUGGEST_FAILED_BODY, status=e.http_status)
+    
+    return _raw_json_response(body)
 
 
-@api_view(['GET'])
+@never_cache
+@require_http_methods(['GET'])
 def health_check(request):
     """
     GET /api/health/
     
-    Simple health check endpoint.
+    Simple health check endpoint. Never cached, so probes always reach the app.
     """
-    return Response({
-        'status': 'healthy',
-        'service': 'Smart Task Analyzer API',
-        'version': '1.0.0'
-    })
+    return _raw_json_response(_HEALTH_BODY)